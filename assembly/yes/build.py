@@ -22,8 +22,10 @@ Usage:
     python3 build.py --no-verify                  # skip verification step
 """
 
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 import os
 import shutil
 import argparse
@@ -34,6 +36,13 @@ import tempfile
 MARKER_NASM  = ("; @@DATA_START@@", "; @@DATA_END@@")   # NASM .asm files
 MARKER_GAS   = ("// @@DATA_START@@", "// @@DATA_END@@") # GNU as .s files
 
+# One compiled pattern per marker pair, so patch_asm can locate both
+# markers in a single scan of the source (and notice out-of-order ones).
+_MARKER_RES = {
+    markers: re.compile("|".join(re.escape(m) for m in markers))
+    for markers in (MARKER_NASM, MARKER_GAS)
+}
+
 # Assembly source files relative to this script's directory
 ASM_FILES = {
     "linux-x86_64":  "fyes.asm",
@@ -158,12 +167,11 @@ def detect_system_yes(target):
     _, err_long, _  = capture([yes_cmd, LONG_PROBE])
     _, err_short, _ = capture([yes_cmd, "-{}".format(SHORT_PROBE)])
 
-    long_lines  = err_long.split(b"\n")
-    short_lines = err_short.split(b"\n")
-
-    line1_long  = long_lines[0]
-    line1_short = short_lines[0]
-    try_line    = long_lines[1] if len(long_lines) > 1 else b""
+    # Only the first line (and the "Try ..." line after it) matter, so
+    # partition instead of splitting the whole stderr into a list.
+    line1_long, _, rest = err_long.partition(b"\n")
+    try_line, _, _      = rest.partition(b"\n")
+    line1_short, _, _   = err_short.partition(b"\n")
 
     opt_pos = line1_long.find(LONG_PROBE.encode())
     if opt_pos < 0:
@@ -215,13 +223,24 @@ def print_detection(data):
 # Data section generation
 # =============================================================================
 
+def hex_lines(data):
+    """
+    Yield '0xaa, 0xbb, ...' strings covering data in 16-byte lines.
+
+    bytes.hex(sep) converts the whole buffer in one C call; each 16-byte
+    line is then a 47-char slice (16 pairs + 15 separators) with the
+    '0x' prefixes interleaved by a single bulk str.replace.
+    """
+    h = data.hex(",", 1)
+    for i in range(0, len(h), 48):
+        yield "0x" + h[i:i + 47].replace(",", ", 0x")
+
+
 def bytes_to_nasm(data, label):
     """Convert bytes to NASM `db` directives."""
     lines = []
-    for i in range(0, len(data), 16):
-        chunk = data[i:i + 16]
-        hexb  = ", ".join("0x{:02x}".format(b) for b in chunk)
-        if i == 0:
+    for n, hexb in enumerate(hex_lines(data)):
+        if n == 0:
             lines.append("{:<16}db {}".format(label, hexb))
         else:
             lines.append("                db {}".format(hexb))
@@ -231,9 +250,7 @@ def bytes_to_nasm(data, label):
 def bytes_to_gas(data, label):
     """Convert bytes to GNU as `.byte` directives."""
     lines = ["{}:".format(label)]
-    for i in range(0, len(data), 16):
-        chunk = data[i:i + 16]
-        hexb  = ", ".join("0x{:02x}".format(b) for b in chunk)
+    for hexb in hex_lines(data):
         lines.append("    .byte {}".format(hexb))
     return "\n".join(lines)
 
@@ -318,10 +335,12 @@ def patch_asm(src_path, new_data, markers):
         content = f.read()
 
     start_marker, end_marker = markers
-    start_idx = content.find(start_marker)
-    end_idx   = content.find(end_marker)
+    # One scan finds both markers, and misordered markers are caught
+    # instead of silently producing garbage via index arithmetic.
+    matches = list(_MARKER_RES[markers].finditer(content))
 
-    if start_idx < 0 or end_idx < 0:
+    if (len(matches) != 2 or matches[0].group() != start_marker
+            or matches[1].group() != end_marker):
         print("  [warn] markers not found in {}; using file as-is".format(src_path),
               file=sys.stderr)
         ext = os.path.splitext(src_path)[1]
@@ -330,14 +349,14 @@ def patch_asm(src_path, new_data, markers):
         shutil.copy2(src_path, tmp)
         return tmp
 
-    before  = content[:start_idx + len(start_marker)]
-    after   = content[end_idx:]
+    before  = content[:matches[0].end()]
+    after   = content[matches[1].start():]
     patched = "{}\n{}\n{}".format(before, new_data, after)
 
     ext = os.path.splitext(src_path)[1]
     fd, tmp = tempfile.mkstemp(suffix=ext)
     os.close(fd)
-    with open(tmp, "w") as f:
+    with open(tmp, "w", buffering=1 << 16) as f:
         f.write(patched)
     return tmp
 
@@ -471,64 +490,77 @@ def verify(binary, target):
         if ok: passed += 1
         else:  failed += 1
 
+    # Every capture below is independent and spends its time waiting on
+    # a child process, so launch them all at once and join before
+    # evaluating the assertions. This keeps the build.py inner loop fast.
+    cmds = {
+        "default":   ["sh", "-c", "{} | head -n 5".format(binary_path)],
+        "hello":     ["sh", "-c", "{} hello | head -n 3".format(binary_path)],
+        "multi":     ["sh", "-c", "{} a b | head -n 3".format(binary_path)],
+        "epipe":     ["sh", "-c", "{} | head -n 1".format(binary_path)],
+        "ddash_foo": ["sh", "-c", "{} -- foo | head -n 2".format(binary_path)],
+        "ddash":     ["sh", "-c", "{} -- -- | head -n 2".format(binary_path)],
+        "badopt":    [binary_path, "--bad-option"],
+        "shortopt":  [binary_path, "-x"],
+        "help":      [binary_path, "--help"],
+        "version":   [binary_path, "--version"],
+    }
+    if not is_macos:
+        cmds.update({
+            "yes_default":  ["sh", "-c", "yes | head -n 5"],
+            "yes_help":     ["yes", "--help"],
+            "yes_version":  ["yes", "--version"],
+            "yes_badlong":  ["yes", "--bad-test-option"],
+            "f_badlong":    [binary_path, "--bad-test-option"],
+            "yes_badshort": ["yes", "-z"],
+            "f_badshort":   [binary_path, "-z"],
+        })
+
+    with ThreadPoolExecutor(max_workers=len(cmds)) as ex:
+        futures = {name: ex.submit(capture, cmd) for name, cmd in cmds.items()}
+        res = {name: f.result() for name, f in futures.items()}
+
     # Basic: default output
-    fo, _, _ = capture(["sh", "-c", "{} | head -n 5".format(binary_path)])
-    test("default output (y\\n x5)", fo == b"y\ny\ny\ny\ny\n")
+    test("default output (y\\n x5)", res["default"][0] == b"y\ny\ny\ny\ny\n")
 
     # Custom string
-    fo, _, _ = capture(["sh", "-c", "{} hello | head -n 3".format(binary_path)])
-    test("custom string 'hello'", fo == b"hello\nhello\nhello\n")
+    test("custom string 'hello'", res["hello"][0] == b"hello\nhello\nhello\n")
 
     # Multiple args
-    fo, _, _ = capture(["sh", "-c", "{} a b | head -n 3".format(binary_path)])
-    test("multiple args 'a b'", fo == b"a b\na b\na b\n")
+    test("multiple args 'a b'", res["multi"][0] == b"a b\na b\na b\n")
 
     # EPIPE handling
-    fo, _, fr = capture(["sh", "-c", "{} | head -n 1".format(binary_path)])
+    fo, _, fr = res["epipe"]
     test("EPIPE (yes | head -n 1) → exit 0", fo == b"y\n" and fr == 0)
 
     # "--" separator
-    fo, _, _ = capture(["sh", "-c", "{} -- foo | head -n 2".format(binary_path)])
-    test("'-- foo' outputs 'foo' forever", fo == b"foo\nfoo\n")
+    test("'-- foo' outputs 'foo' forever", res["ddash_foo"][0] == b"foo\nfoo\n")
 
     # "--" passed through
-    fo, _, _ = capture(["sh", "-c", "{} -- -- | head -n 2".format(binary_path)])
-    test("'-- --' outputs '--' forever", fo == b"--\n--\n")
+    test("'-- --' outputs '--' forever", res["ddash"][0] == b"--\n--\n")
 
     # Error handling
-    _, _, fr = capture([binary_path, "--bad-option"])
-    test("--bad-option exits 1", fr == 1)
-
-    _, _, fr = capture([binary_path, "-x"])
-    test("-x exits 1", fr == 1)
-
-    _, _, fr = capture([binary_path, "--help"])
-    test("--help exits 0", fr == 0)
-
-    _, _, fr = capture([binary_path, "--version"])
-    test("--version exits 0", fr == 0)
+    test("--bad-option exits 1", res["badopt"][2] == 1)
+    test("-x exits 1", res["shortopt"][2] == 1)
+    test("--help exits 0", res["help"][2] == 0)
+    test("--version exits 0", res["version"][2] == 0)
 
     if not is_macos:
         # On Linux, do full byte-identical comparison with GNU yes
-        fo, _, _ = capture(["sh", "-c", "yes | head -n 5"])
-        fy, _, _ = capture(["sh", "-c", "{} | head -n 5".format(binary_path)])
-        test("byte-identical default output vs GNU yes", fo == fy)
-
-        fo, _, _ = capture(["yes", "--help"])
-        fy, _, _ = capture([binary_path, "--help"])
-        test("--help byte-identical to GNU yes", fo == fy)
-
-        fo, _, _ = capture(["yes", "--version"])
-        fy, _, _ = capture([binary_path, "--version"])
-        test("--version byte-identical to GNU yes", fo == fy)
+        test("byte-identical default output vs GNU yes",
+             res["yes_default"][0] == res["default"][0])
+        test("--help byte-identical to GNU yes",
+             res["yes_help"][0] == res["help"][0])
+        test("--version byte-identical to GNU yes",
+             res["yes_version"][0] == res["version"][0])
 
         # Error message comparison (stderr)
-        _, fe, fr = capture(["yes", "--bad-test-option"])
-        _, fy_e, fy_r = capture([binary_path, "--bad-test-option"])
+        _, fe, fr = res["yes_badlong"]
+        _, fy_e, fy_r = res["f_badlong"]
         test("bad long opt stderr byte-identical", fe == fy_e and fr == fy_r)
 
-        _, fe, fr = capture(["yes", "-z"])
-        _, fy_e, fy_r = capture([binary_path, "-z"])
+        _, fe, fr = res["yes_badshort"]
+        _, fy_e, fy_r = res["f_badshort"]
         test("bad short opt stderr byte-identical", fe == fy_e and fr == fy_r)
 
     print("  {}/{} passed".format(passed, passed + failed))